@@ -1,49 +1,62 @@
+import logging
+import time
 from typing import Any
 import httpx
 from mcp.server.fastmcp import FastMCP
 
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
 # Initialize FastMCP server
 mcp = FastMCP("weather", host="0.0.0.0")
 
 # Constants
 NWS_API_BASE = "https://api.weather.gov"
 USER_AGENT = "weather-app/1.0"
+POINTS_CACHE_TTL = 3600.0  # seconds; NWS grid assignments rarely change
+POINTS_CACHE_MAX_SIZE = 1024
+
+# Shared client so connections to the NWS API are pooled and reused across
+# tool calls instead of paying a TCP/TLS handshake on every request
+http_client = httpx.AsyncClient(
+    headers={"User-Agent": USER_AGENT, "Accept": "application/geo+json"},
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+)
 
 
 async def make_nws_request(url: str) -> dict[str, Any] | None:
     """Make a request to the NWS API with proper error handling."""
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/geo+json"}
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except Exception:
-            return None
+    try:
+        response = await http_client.get(url)
+        response.raise_for_status()
+        return response.json()
+    except Exception:
+        return None
 
 
-def format_alert(feature: dict) -> str:
-    """Format an alert feature into a readable string."""
-    props = feature["properties"]
-    return f"""
-        Event: {props.get('event', 'Unknown')}
-        Area: {props.get('areaDesc', 'Unknown')}
-        Severity: {props.get('severity', 'Unknown')}
-        Description: {props.get('description', 'No description available')}
-        Instructions: {props.get('instruction', 'No specific instructions provided')}
-    """
+# Cache of "lat,lon" -> (fetched_at, points response)
+_points_cache: dict[str, tuple[float, dict[str, Any]]] = {}
 
 
-async def make_nws_request(url: str) -> dict[str, Any] | None:
-    """Make a request to the NWS API with proper error handling."""
-    headers = {"User-Agent": USER_AGENT, "Accept": "application/geo+json"}
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(url, headers=headers, timeout=30.0)
-            response.raise_for_status()
-            return response.json()
-        except Exception:
-            return None
+async def get_points(latitude: str, longitude: str) -> dict[str, Any] | None:
+    """Get NWS grid metadata for a location, serving repeat lookups from cache."""
+    key = f"{latitude},{longitude}"
+    now = time.monotonic()
+    cached = _points_cache.get(key)
+    if cached and now - cached[0] < POINTS_CACHE_TTL:
+        return cached[1]
+
+    data = await make_nws_request(f"{NWS_API_BASE}/points/{key}")
+    if data:
+        if key not in _points_cache and len(_points_cache) >= POINTS_CACHE_MAX_SIZE:
+            # Evict the oldest entry
+            _points_cache.pop(next(iter(_points_cache)))
+        _points_cache[key] = (now, data)
+    return data
 
 
 def format_alert(feature: dict) -> str:
@@ -57,6 +70,7 @@ def format_alert(feature: dict) -> str:
         Instructions: {props.get('instruction', 'No specific instructions provided')}
     """
 
+
 @mcp.tool()
 async def get_alerts(state: str) -> str:
     """Get weather alerts for a US state.
@@ -85,9 +99,8 @@ async def get_forecast(latitude: str, longitude: str) -> str:
         longitude: Longitude of the location
     """
     # First get the forecast grid endpoint
-    print(f"Getting forecast for latitude={latitude} and longitude={longitude}")
-    points_url = f"{NWS_API_BASE}/points/{latitude},{longitude}"
-    points_data = await make_nws_request(points_url)
+    logger.info("Getting forecast for latitude=%s and longitude=%s", latitude, longitude)
+    points_data = await get_points(latitude, longitude)
     if not points_data:
         return "Unable to fetch forecast data for this location."
 